@@ -21,6 +21,17 @@ from _migration_utils import should_skip_due_to_future_migrations, check_column_
 
 MIGRATION_NUMBER = 2
 
+# (column, default) for every quota column added to both User and Organization
+QUOTA_COLUMNS = (
+    ("private_quota_bytes", "NULL"),
+    ("public_quota_bytes", "NULL"),
+    ("private_used_bytes", "0"),
+    ("public_used_bytes", "0"),
+)
+
+# (table, label) pairs the quota columns are added to
+QUOTA_TABLES = (("user", "User"), ("organization", "Organization"))
+
 
 def is_applied(db, cfg):
     """Check if THIS migration has been applied.
@@ -51,69 +62,52 @@ def check_migration_needed():
         return "private_quota_bytes" not in columns
 
 
+def _missing_column_ddl(cursor, table, label, columns):
+    """Return ALTER TABLE statements for ``columns`` missing from a SQLite table.
+
+    ``columns`` maps column name to definition. Reads the table's columns with
+    a single PRAGMA table_info; returns a list of (label, sql) pairs.
+    """
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in cursor.fetchall()}
+
+    statements = []
+    for column, definition in columns.items():
+        if column in existing:
+            print(f"  - {label}.{column} already exists")
+            continue
+        statements.append(
+            (
+                f"{label}.{column}",
+                f"ALTER TABLE {table} ADD COLUMN {column} {definition}",
+            )
+        )
+    return statements
+
+
 def migrate_sqlite():
     """Migrate SQLite database.
 
     Note: This function runs inside a transaction (db.atomic()).
     Do NOT call db.commit() or db.rollback() inside this function.
+
+    All missing columns are collected first and then applied back-to-back,
+    so the whole batch is committed once by the surrounding db.atomic().
+    sqlite3's executescript() is deliberately not used: it commits any open
+    transaction before running, which would break the atomic block.
     """
     cursor = db.cursor()
+    columns = {
+        column: f"INTEGER DEFAULT {default}" for column, default in QUOTA_COLUMNS
+    }
 
-    # User table
-    for column, sql in [
-        (
-            "private_quota_bytes",
-            "ALTER TABLE user ADD COLUMN private_quota_bytes INTEGER DEFAULT NULL",
-        ),
-        (
-            "public_quota_bytes",
-            "ALTER TABLE user ADD COLUMN public_quota_bytes INTEGER DEFAULT NULL",
-        ),
-        (
-            "private_used_bytes",
-            "ALTER TABLE user ADD COLUMN private_used_bytes INTEGER DEFAULT 0",
-        ),
-        (
-            "public_used_bytes",
-            "ALTER TABLE user ADD COLUMN public_used_bytes INTEGER DEFAULT 0",
-        ),
-    ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added User.{column}")
-        except Exception as e:
-            if "duplicate column" in str(e).lower():
-                print(f"  - User.{column} already exists")
-            else:
-                raise
-
-    # Organization table
-    for column, sql in [
-        (
-            "private_quota_bytes",
-            "ALTER TABLE organization ADD COLUMN private_quota_bytes INTEGER DEFAULT NULL",
-        ),
-        (
-            "public_quota_bytes",
-            "ALTER TABLE organization ADD COLUMN public_quota_bytes INTEGER DEFAULT NULL",
-        ),
-        (
-            "private_used_bytes",
-            "ALTER TABLE organization ADD COLUMN private_used_bytes INTEGER DEFAULT 0",
-        ),
-        (
-            "public_used_bytes",
-            "ALTER TABLE organization ADD COLUMN public_used_bytes INTEGER DEFAULT 0",
-        ),
-    ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added Organization.{column}")
-        except Exception as e:
-            if "duplicate column" in str(e).lower():
-                print(f"  - Organization.{column} already exists")
-            else:
-                raise
+    statements = []
+    for table, label in QUOTA_TABLES:
+        statements.extend(_missing_column_ddl(cursor, table, label, columns))
+
+    for label, sql in statements:
+        cursor.execute(sql)
+        print(f"  ✓ Added {label}")
 
 
 def migrate_postgres():
@@ -121,64 +115,36 @@ def migrate_postgres():
 
     Note: This function runs inside a transaction (db.atomic()).
     Do NOT call db.commit() or db.rollback() inside this function.
+
+    PostgreSQL accepts several actions in one ALTER TABLE, so each table is
+    altered with a single statement (one round-trip, one table lock) instead
+    of one statement per column. IF NOT EXISTS keeps it idempotent.
     """
     cursor = db.cursor()
+    actions = ",\n".join(
+        f"ADD COLUMN IF NOT EXISTS {column} BIGINT DEFAULT {default}"
+        for column, default in QUOTA_COLUMNS
+    )
 
-    # User table
-    for column, sql in [
-        (
-            "private_quota_bytes",
-            'ALTER TABLE "user" ADD COLUMN private_quota_bytes BIGINT DEFAULT NULL',
-        ),
-        (
-            "public_quota_bytes",
-            'ALTER TABLE "user" ADD COLUMN public_quota_bytes BIGINT DEFAULT NULL',
-        ),
-        (
-            "private_used_bytes",
-            'ALTER TABLE "user" ADD COLUMN private_used_bytes BIGINT DEFAULT 0',
-        ),
-        (
-            "public_used_bytes",
-            'ALTER TABLE "user" ADD COLUMN public_used_bytes BIGINT DEFAULT 0',
-        ),
-    ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added User.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - User.{column} already exists")
-            else:
-                raise
-
-    # Organization table
-    for column, sql in [
-        (
-            "private_quota_bytes",
-            "ALTER TABLE organization ADD COLUMN private_quota_bytes BIGINT DEFAULT NULL",
-        ),
-        (
-            "public_quota_bytes",
-            "ALTER TABLE organization ADD COLUMN public_quota_bytes BIGINT DEFAULT NULL",
-        ),
-        (
-            "private_used_bytes",
-            "ALTER TABLE organization ADD COLUMN private_used_bytes BIGINT DEFAULT 0",
-        ),
-        (
-            "public_used_bytes",
-            "ALTER TABLE organization ADD COLUMN public_used_bytes BIGINT DEFAULT 0",
-        ),
-    ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added Organization.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - Organization.{column} already exists")
-            else:
-                raise
+    for table, label in QUOTA_TABLES:
+        cursor.execute(f'ALTER TABLE "{table}" {actions}')
+        print(f"  ✓ Added {label} quota columns")
+
+
+def analyze_tables():
+    """Refresh planner statistics for the altered tables.
+
+    Must run after the migration transaction has committed, so the table
+    locks taken by ALTER TABLE are not held for the sampling pass.
+    """
+    cursor = db.cursor()
+    if cfg.app.db_backend == "postgres":
+        cursor.execute(
+            "ANALYZE " + ", ".join(f'"{table}"' for table, _ in QUOTA_TABLES)
+        )
+    else:
+        for table, _ in QUOTA_TABLES:
+            cursor.execute(f"ANALYZE {table}")
 
 
 def run():
@@ -209,6 +175,12 @@ def run():
             else:
                 migrate_sqlite()
 
+        # The migration is committed; a stats refresh failure must not fail it
+        try:
+            analyze_tables()
+        except Exception as e:
+            print(f"  WARNING: ANALYZE failed (migration already committed): {e}")
+
         print("Migration 002: ✓ Completed")
         return True
 
@@ -89,18 +89,15 @@ def migrate_postgres():
     for column, sql in [
         (
             "quota_bytes",
-            "ALTER TABLE repository ADD COLUMN quota_bytes BIGINT DEFAULT NULL",
+            "ALTER TABLE repository ADD COLUMN IF NOT EXISTS quota_bytes BIGINT DEFAULT NULL",
+        ),
+        (
+            "used_bytes",
+            "ALTER TABLE repository ADD COLUMN IF NOT EXISTS used_bytes BIGINT DEFAULT 0",
         ),
-        ("used_bytes", "ALTER TABLE repository ADD COLUMN used_bytes BIGINT DEFAULT 0"),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added Repository.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - Repository.{column} already exists")
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  ✓ Added Repository.{column}")
 
 
 def run():
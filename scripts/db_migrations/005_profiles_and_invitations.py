@@ -155,87 +155,69 @@ def migrate_postgres():
     for column, sql in [
         (
             "full_name",
-            'ALTER TABLE "user" ADD COLUMN full_name VARCHAR(255) DEFAULT NULL',
+            'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS full_name VARCHAR(255) DEFAULT NULL',
+        ),
+        ("bio", 'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS bio TEXT DEFAULT NULL'),
+        (
+            "website",
+            'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS website VARCHAR(255) DEFAULT NULL',
         ),
-        ("bio", 'ALTER TABLE "user" ADD COLUMN bio TEXT DEFAULT NULL'),
-        ("website", 'ALTER TABLE "user" ADD COLUMN website VARCHAR(255) DEFAULT NULL'),
         (
             "social_media",
-            'ALTER TABLE "user" ADD COLUMN social_media TEXT DEFAULT NULL',
+            'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS social_media TEXT DEFAULT NULL',
         ),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added User.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - User.{column} already exists")
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  ✓ Added User.{column}")
 
     # Organization profile fields
     for column, sql in [
-        ("bio", "ALTER TABLE organization ADD COLUMN bio TEXT DEFAULT NULL"),
+        (
+            "bio",
+            "ALTER TABLE organization ADD COLUMN IF NOT EXISTS bio TEXT DEFAULT NULL",
+        ),
         (
             "website",
-            "ALTER TABLE organization ADD COLUMN website VARCHAR(255) DEFAULT NULL",
+            "ALTER TABLE organization ADD COLUMN IF NOT EXISTS website VARCHAR(255) DEFAULT NULL",
         ),
         (
             "social_media",
-            "ALTER TABLE organization ADD COLUMN social_media TEXT DEFAULT NULL",
+            "ALTER TABLE organization ADD COLUMN IF NOT EXISTS social_media TEXT DEFAULT NULL",
         ),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added Organization.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - Organization.{column} already exists")
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  ✓ Added Organization.{column}")
 
     # Create Invitation table
-    try:
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS invitation (
-                id SERIAL PRIMARY KEY,
-                token VARCHAR(255) UNIQUE NOT NULL,
-                action VARCHAR(255) NOT NULL,
-                parameters TEXT NOT NULL,
-                created_by INTEGER NOT NULL,
-                expires_at TIMESTAMP NOT NULL,
-                max_usage INTEGER DEFAULT NULL,
-                usage_count INTEGER DEFAULT 0,
-                used_at TIMESTAMP DEFAULT NULL,
-                used_by INTEGER DEFAULT NULL,
-                created_at TIMESTAMP NOT NULL
-            )
+    cursor.execute(
         """
+        CREATE TABLE IF NOT EXISTS invitation (
+            id SERIAL PRIMARY KEY,
+            token VARCHAR(255) UNIQUE NOT NULL,
+            action VARCHAR(255) NOT NULL,
+            parameters TEXT NOT NULL,
+            created_by INTEGER NOT NULL,
+            expires_at TIMESTAMP NOT NULL,
+            max_usage INTEGER DEFAULT NULL,
+            usage_count INTEGER DEFAULT 0,
+            used_at TIMESTAMP DEFAULT NULL,
+            used_by INTEGER DEFAULT NULL,
+            created_at TIMESTAMP NOT NULL
         )
-        print("  ✓ Created Invitation table")
-
-        # Create indexes
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS invitation_token ON invitation(token)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS invitation_action ON invitation(action)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS invitation_created_by ON invitation(created_by)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS invitation_action_created_by ON invitation(action, created_by)"
-        )
-        print("  ✓ Created Invitation indexes")
-
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - Invitation table already exists")
-            db.rollback()
-        else:
-            raise
+        """
+    )
+    print("  ✓ Created Invitation table")
+
+    # Create indexes
+    cursor.execute("CREATE INDEX IF NOT EXISTS invitation_token ON invitation(token)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS invitation_action ON invitation(action)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS invitation_created_by ON invitation(created_by)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS invitation_action_created_by ON invitation(action, created_by)"
+    )
+    print("  ✓ Created Invitation indexes")
 
 
 def run():
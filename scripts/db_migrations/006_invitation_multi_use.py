@@ -135,36 +135,27 @@ def migrate_postgres():
     for column, sql in [
         (
             "max_usage",
-            "ALTER TABLE invitation ADD COLUMN max_usage INTEGER DEFAULT NULL",
+            "ALTER TABLE invitation ADD COLUMN IF NOT EXISTS max_usage INTEGER DEFAULT NULL",
         ),
         (
             "usage_count",
-            "ALTER TABLE invitation ADD COLUMN usage_count INTEGER DEFAULT 0",
+            "ALTER TABLE invitation ADD COLUMN IF NOT EXISTS usage_count INTEGER DEFAULT 0",
         ),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added Invitation.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - Invitation.{column} already exists")
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  ✓ Added Invitation.{column}")
 
     # Migrate existing data: Set usage_count=1 for used invitations
-    try:
-        cursor.execute(
-            """
-            UPDATE invitation
-            SET usage_count = 1
-            WHERE used_at IS NOT NULL AND usage_count = 0
+    cursor.execute(
         """
-        )
-        updated = cursor.rowcount
-        if updated > 0:
-            print(f"  ✓ Migrated {updated} existing invitation(s) usage data")
-    except Exception as e:
-        print(f"  - Warning: Could not migrate existing data: {e}")
+        UPDATE invitation
+        SET usage_count = 1
+        WHERE used_at IS NOT NULL AND usage_count = 0
+        """
+    )
+    updated = cursor.rowcount
+    if updated > 0:
+        print(f"  ✓ Migrated {updated} existing invitation(s) usage data")
 
 
 def run():
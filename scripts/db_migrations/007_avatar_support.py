@@ -133,37 +133,31 @@ def migrate_postgres():
 
     # User avatar fields
     for column, sql in [
-        ("avatar", 'ALTER TABLE "user" ADD COLUMN avatar BYTEA DEFAULT NULL'),
+        (
+            "avatar",
+            'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS avatar BYTEA DEFAULT NULL',
+        ),
         (
             "avatar_updated_at",
-            'ALTER TABLE "user" ADD COLUMN avatar_updated_at TIMESTAMP DEFAULT NULL',
+            'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS avatar_updated_at TIMESTAMP DEFAULT NULL',
         ),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added User.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - User.{column} already exists")
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  ✓ Added User.{column}")
 
     # Organization avatar fields
     for column, sql in [
-        ("avatar", "ALTER TABLE organization ADD COLUMN avatar BYTEA DEFAULT NULL"),
+        (
+            "avatar",
+            "ALTER TABLE organization ADD COLUMN IF NOT EXISTS avatar BYTEA DEFAULT NULL",
+        ),
         (
             "avatar_updated_at",
-            "ALTER TABLE organization ADD COLUMN avatar_updated_at TIMESTAMP DEFAULT NULL",
+            "ALTER TABLE organization ADD COLUMN IF NOT EXISTS avatar_updated_at TIMESTAMP DEFAULT NULL",
         ),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added Organization.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - Organization.{column} already exists")
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  ✓ Added Organization.{column}")
 
 
 def run():
@@ -431,43 +431,25 @@ def migrate_postgres():
     print("\n=== Phase 2: Add new columns to User table ===")
 
     # Add is_org column
-    try:
-        cursor.execute('ALTER TABLE "user" ADD COLUMN is_org BOOLEAN DEFAULT FALSE')
-        print("  ✓ Added User.is_org")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - User.is_org already exists")
-        else:
-            raise
+    cursor.execute(
+        'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS is_org BOOLEAN DEFAULT FALSE'
+    )
+    print("  ✓ Added User.is_org")
 
     # Add description column
-    try:
-        cursor.execute('ALTER TABLE "user" ADD COLUMN description TEXT DEFAULT NULL')
-        print("  ✓ Added User.description")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - User.description already exists")
-        else:
-            raise
+    cursor.execute(
+        'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS description TEXT DEFAULT NULL'
+    )
+    print("  ✓ Added User.description")
 
     # Add normalized_name column (for O(1) conflict checking)
-    try:
-        cursor.execute('ALTER TABLE "user" ADD COLUMN normalized_name TEXT')
-        print("  ✓ Added User.normalized_name")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - User.normalized_name already exists")
-        else:
-            raise
+    cursor.execute('ALTER TABLE "user" ADD COLUMN IF NOT EXISTS normalized_name TEXT')
+    print("  ✓ Added User.normalized_name")
 
-    # Make email and password_hash nullable
-    try:
-        cursor.execute('ALTER TABLE "user" ALTER COLUMN email DROP NOT NULL')
-        cursor.execute('ALTER TABLE "user" ALTER COLUMN password_hash DROP NOT NULL')
-        print("  ✓ Made email and password_hash nullable")
-    except Exception as e:
-        print(f"  - Failed to make columns nullable (may already be nullable): {e}")
-        db.rollback()
+    # Make email and password_hash nullable (no-op if already nullable)
+    cursor.execute('ALTER TABLE "user" ALTER COLUMN email DROP NOT NULL')
+    cursor.execute('ALTER TABLE "user" ALTER COLUMN password_hash DROP NOT NULL')
+    print("  ✓ Made email and password_hash nullable")
 
     # Populate normalized_name for existing users
     print("  Populating User.normalized_name for existing users...")
@@ -580,14 +562,8 @@ def migrate_postgres():
 
     # 4b. Add owner column to File table (denormalized from repository.owner)
     print("  Adding File.owner_id column...")
-    try:
-        cursor.execute("ALTER TABLE file ADD COLUMN owner_id INTEGER")
-        print("    ✓ Added File.owner_id column")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("    - File.owner_id already exists")
-        else:
-            raise
+    cursor.execute("ALTER TABLE file ADD COLUMN IF NOT EXISTS owner_id INTEGER")
+    print("    ✓ Added File.owner_id column")
 
     # Update File.owner_id from Repository.owner_id
     cursor.execute(
@@ -601,14 +577,8 @@ def migrate_postgres():
 
     # 4c. Add owner column to Commit table (repository owner)
     print("  Adding Commit.owner_id column...")
-    try:
-        cursor.execute("ALTER TABLE commit ADD COLUMN owner_id INTEGER")
-        print("    ✓ Added Commit.owner_id column")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("    - Commit.owner_id already exists")
-        else:
-            raise
+    cursor.execute("ALTER TABLE commit ADD COLUMN IF NOT EXISTS owner_id INTEGER")
+    print("    ✓ Added Commit.owner_id column")
 
     # Update Commit.owner_id from Repository.owner_id
     cursor.execute(
@@ -622,29 +592,17 @@ def migrate_postgres():
 
     # 4d. Add uploader column to StagingUpload table
     print("  Adding StagingUpload.uploader_id column...")
-    try:
-        cursor.execute(
-            "ALTER TABLE stagingupload ADD COLUMN uploader_id INTEGER DEFAULT NULL"
-        )
-        print("    ✓ Added StagingUpload.uploader_id column")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("    - StagingUpload.uploader_id already exists")
-        else:
-            raise
+    cursor.execute(
+        "ALTER TABLE stagingupload ADD COLUMN IF NOT EXISTS uploader_id INTEGER DEFAULT NULL"
+    )
+    print("    ✓ Added StagingUpload.uploader_id column")
 
     # 4e. Add file FK column to LFSObjectHistory table
     print("  Adding LFSObjectHistory.file_id column...")
-    try:
-        cursor.execute(
-            "ALTER TABLE lfsobjecthistory ADD COLUMN file_id INTEGER DEFAULT NULL"
-        )
-        print("    ✓ Added LFSObjectHistory.file_id column")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("    - LFSObjectHistory.file_id already exists")
-        else:
-            raise
+    cursor.execute(
+        "ALTER TABLE lfsobjecthistory ADD COLUMN IF NOT EXISTS file_id INTEGER DEFAULT NULL"
+    )
+    print("    ✓ Added LFSObjectHistory.file_id column")
 
     # Update LFSObjectHistory.file_id from File table
     cursor.execute(
@@ -95,26 +95,19 @@ def migrate_postgres():
     for column, sql in [
         (
             "lfs_threshold_bytes",
-            "ALTER TABLE repository ADD COLUMN lfs_threshold_bytes INTEGER DEFAULT NULL",
+            "ALTER TABLE repository ADD COLUMN IF NOT EXISTS lfs_threshold_bytes INTEGER DEFAULT NULL",
         ),
         (
             "lfs_keep_versions",
-            "ALTER TABLE repository ADD COLUMN lfs_keep_versions INTEGER DEFAULT NULL",
+            "ALTER TABLE repository ADD COLUMN IF NOT EXISTS lfs_keep_versions INTEGER DEFAULT NULL",
         ),
         (
             "lfs_suffix_rules",
-            "ALTER TABLE repository ADD COLUMN lfs_suffix_rules TEXT DEFAULT NULL",
+            "ALTER TABLE repository ADD COLUMN IF NOT EXISTS lfs_suffix_rules TEXT DEFAULT NULL",
         ),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ Added Repository.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - Repository.{column} already exists")
-                # Don't need to rollback - the exception will propagate and rollback the entire transaction
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  ✓ Added Repository.{column}")
 
 
 def run():
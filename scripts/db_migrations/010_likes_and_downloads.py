@@ -213,135 +213,108 @@ def migrate_postgres():
     for column, sql in [
         (
             "downloads",
-            "ALTER TABLE repository ADD COLUMN downloads INTEGER DEFAULT 0",
+            "ALTER TABLE repository ADD COLUMN IF NOT EXISTS downloads INTEGER DEFAULT 0",
         ),
         (
             "likes_count",
-            "ALTER TABLE repository ADD COLUMN likes_count INTEGER DEFAULT 0",
+            "ALTER TABLE repository ADD COLUMN IF NOT EXISTS likes_count INTEGER DEFAULT 0",
         ),
     ]:
-        try:
-            cursor.execute(sql)
-            print(f"  [OK] Added Repository.{column}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  - Repository.{column} already exists")
-            else:
-                raise
+        cursor.execute(sql)
+        print(f"  [OK] Added Repository.{column}")
 
     # Create RepositoryLike table
-    try:
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS repositorylike (
-                id SERIAL PRIMARY KEY,
-                repository_id INTEGER NOT NULL REFERENCES repository(id) ON DELETE CASCADE,
-                user_id INTEGER NOT NULL REFERENCES "user"(id) ON DELETE CASCADE,
-                created_at TIMESTAMP NOT NULL
-            )
+    cursor.execute(
         """
+        CREATE TABLE IF NOT EXISTS repositorylike (
+            id SERIAL PRIMARY KEY,
+            repository_id INTEGER NOT NULL REFERENCES repository(id) ON DELETE CASCADE,
+            user_id INTEGER NOT NULL REFERENCES "user"(id) ON DELETE CASCADE,
+            created_at TIMESTAMP NOT NULL
         )
-        print("  [OK] Created RepositoryLike table")
-
-        # Create indexes
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS repositorylike_repository_id ON repositorylike(repository_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS repositorylike_user_id ON repositorylike(user_id)"
-        )
-        cursor.execute(
-            "CREATE UNIQUE INDEX IF NOT EXISTS repositorylike_repository_user ON repositorylike(repository_id, user_id)"
-        )
-        print("  [OK] Created RepositoryLike indexes")
-
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - RepositoryLike table already exists")
-        else:
-            raise
+    """
+    )
+    print("  [OK] Created RepositoryLike table")
+
+    # Create indexes
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS repositorylike_repository_id ON repositorylike(repository_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS repositorylike_user_id ON repositorylike(user_id)"
+    )
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS repositorylike_repository_user ON repositorylike(repository_id, user_id)"
+    )
+    print("  [OK] Created RepositoryLike indexes")
 
     # Create DownloadSession table
-    try:
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS downloadsession (
-                id SERIAL PRIMARY KEY,
-                repository_id INTEGER NOT NULL REFERENCES repository(id) ON DELETE CASCADE,
-                user_id INTEGER REFERENCES "user"(id) ON DELETE SET NULL,
-                session_id VARCHAR(255) NOT NULL,
-                time_bucket INTEGER NOT NULL,
-                file_count INTEGER DEFAULT 1,
-                first_file VARCHAR(255) NOT NULL,
-                first_download_at TIMESTAMP NOT NULL,
-                last_download_at TIMESTAMP NOT NULL
-            )
+    cursor.execute(
         """
+        CREATE TABLE IF NOT EXISTS downloadsession (
+            id SERIAL PRIMARY KEY,
+            repository_id INTEGER NOT NULL REFERENCES repository(id) ON DELETE CASCADE,
+            user_id INTEGER REFERENCES "user"(id) ON DELETE SET NULL,
+            session_id VARCHAR(255) NOT NULL,
+            time_bucket INTEGER NOT NULL,
+            file_count INTEGER DEFAULT 1,
+            first_file VARCHAR(255) NOT NULL,
+            first_download_at TIMESTAMP NOT NULL,
+            last_download_at TIMESTAMP NOT NULL
         )
-        print("  [OK] Created DownloadSession table")
-
-        # Create indexes
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS downloadsession_repository_id ON downloadsession(repository_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS downloadsession_user_id ON downloadsession(user_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS downloadsession_session_id ON downloadsession(session_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS downloadsession_time_bucket ON downloadsession(time_bucket)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS downloadsession_first_download_at ON downloadsession(first_download_at)"
-        )
-        cursor.execute(
-            "CREATE UNIQUE INDEX IF NOT EXISTS downloadsession_dedup ON downloadsession(repository_id, session_id, time_bucket)"
-        )
-        print("  [OK] Created DownloadSession indexes")
-
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - DownloadSession table already exists")
-        else:
-            raise
+    """
+    )
+    print("  [OK] Created DownloadSession table")
+
+    # Create indexes
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS downloadsession_repository_id ON downloadsession(repository_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS downloadsession_user_id ON downloadsession(user_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS downloadsession_session_id ON downloadsession(session_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS downloadsession_time_bucket ON downloadsession(time_bucket)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS downloadsession_first_download_at ON downloadsession(first_download_at)"
+    )
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS downloadsession_dedup ON downloadsession(repository_id, session_id, time_bucket)"
+    )
+    print("  [OK] Created DownloadSession indexes")
 
     # Create DailyRepoStats table
-    try:
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS dailyrepostats (
-                id SERIAL PRIMARY KEY,
-                repository_id INTEGER NOT NULL REFERENCES repository(id) ON DELETE CASCADE,
-                date DATE NOT NULL,
-                download_sessions INTEGER DEFAULT 0,
-                authenticated_downloads INTEGER DEFAULT 0,
-                anonymous_downloads INTEGER DEFAULT 0,
-                total_files INTEGER DEFAULT 0,
-                created_at TIMESTAMP NOT NULL
-            )
+    cursor.execute(
         """
+        CREATE TABLE IF NOT EXISTS dailyrepostats (
+            id SERIAL PRIMARY KEY,
+            repository_id INTEGER NOT NULL REFERENCES repository(id) ON DELETE CASCADE,
+            date DATE NOT NULL,
+            download_sessions INTEGER DEFAULT 0,
+            authenticated_downloads INTEGER DEFAULT 0,
+            anonymous_downloads INTEGER DEFAULT 0,
+            total_files INTEGER DEFAULT 0,
+            created_at TIMESTAMP NOT NULL
         )
-        print("  [OK] Created DailyRepoStats table")
-
-        # Create indexes
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS dailyrepostats_repository_id ON dailyrepostats(repository_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS dailyrepostats_date ON dailyrepostats(date)"
-        )
-        cursor.execute(
-            "CREATE UNIQUE INDEX IF NOT EXISTS dailyrepostats_repo_date ON dailyrepostats(repository_id, date)"
-        )
-        print("  [OK] Created DailyRepoStats indexes")
-
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - DailyRepoStats table already exists")
-        else:
-            raise
+    """
+    )
+    print("  [OK] Created DailyRepoStats table")
+
+    # Create indexes
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS dailyrepostats_repository_id ON dailyrepostats(repository_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS dailyrepostats_date ON dailyrepostats(date)"
+    )
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS dailyrepostats_repo_date ON dailyrepostats(repository_id, date)"
+    )
+    print("  [OK] Created DailyRepoStats indexes")
 
 
 def run():
@@ -160,45 +160,32 @@ def migrate_postgres():
     cursor = db.cursor()
 
     # Step 1: Add is_deleted column to File table
-    try:
-        cursor.execute(
-            "ALTER TABLE file ADD COLUMN is_deleted BOOLEAN DEFAULT FALSE NOT NULL"
-        )
-        print("  [OK] Added File.is_deleted column")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print("  - File.is_deleted already exists")
-        else:
-            raise
+    cursor.execute(
+        "ALTER TABLE file ADD COLUMN IF NOT EXISTS is_deleted BOOLEAN DEFAULT FALSE NOT NULL"
+    )
+    print("  [OK] Added File.is_deleted column")
 
     # Step 2: Update LFSObjectHistory FK constraint (CASCADE -> SET NULL)
     print("  [INFO] Updating LFSObjectHistory.file FK constraint...")
 
-    try:
-        # Drop existing FK constraint
-        cursor.execute(
-            """
-            ALTER TABLE lfsobjecthistory
-            DROP CONSTRAINT IF EXISTS lfsobjecthistory_file_id_fkey
+    # Drop existing FK constraint
+    cursor.execute(
         """
-        )
-        print("    [OK] Dropped old FK constraint")
+        ALTER TABLE lfsobjecthistory
+        DROP CONSTRAINT IF EXISTS lfsobjecthistory_file_id_fkey
+    """
+    )
+    print("    [OK] Dropped old FK constraint")
 
-        # Add new FK constraint with SET NULL
-        cursor.execute(
-            """
-            ALTER TABLE lfsobjecthistory
-            ADD CONSTRAINT lfsobjecthistory_file_id_fkey
-            FOREIGN KEY (file_id) REFERENCES file (id) ON DELETE SET NULL
+    # Add new FK constraint with SET NULL
+    cursor.execute(
         """
-        )
-        print("    [OK] Added new FK constraint with ON DELETE SET NULL")
-
-    except Exception as e:
-        if "does not exist" in str(e).lower():
-            print("    - FK constraint already correct or doesn't need updating")
-        else:
-            raise
+        ALTER TABLE lfsobjecthistory
+        ADD CONSTRAINT lfsobjecthistory_file_id_fkey
+        FOREIGN KEY (file_id) REFERENCES file (id) ON DELETE SET NULL
+    """
+    )
+    print("    [OK] Added new FK constraint with ON DELETE SET NULL")
 
 
 def run():
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Migration 016: Drop redundant SSHKey.user_id index.
+
+The unique (user_id, fingerprint) index already has user_id as its leftmost
+column, so it serves every "WHERE user_id = ?" lookup on its own. The
+standalone sshkey_user_id index only adds write cost on every key insert.
+
+Changes:
+- Drop index sshkey_user_id (kept: sshkey_fingerprint, sshkey_user_id_fingerprint)
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+# Add db_migrations to path (for _migration_utils)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from kohakuhub.config import cfg
+from kohakuhub.db import db
+from _migration_utils import (
+    check_index_exists,
+    check_table_exists,
+    should_skip_due_to_future_migrations,
+)
+
+MIGRATION_NUMBER = 16
+
+
+def is_applied(db, cfg):
+    """Check if THIS migration has been applied.
+
+    Returns True if the SSHKey table exists without the sshkey_user_id index.
+    """
+    return check_table_exists(db, "sshkey") and not check_index_exists(
+        db, cfg, "sshkey", "sshkey_user_id"
+    )
+
+
+def check_migration_needed():
+    """Check if the redundant index is still present."""
+    return check_index_exists(db, cfg, "sshkey", "sshkey_user_id")
+
+
+def migrate_postgres():
+    """Drop redundant SSHKey index in PostgreSQL.
+
+    Note: This function must NOT run inside a transaction (db.atomic()).
+    DROP INDEX CONCURRENTLY avoids blocking writers on sshkey while the
+    index is removed, but PostgreSQL refuses to run it in a transaction block.
+    """
+    cursor = db.cursor()
+    cursor.execute("DROP INDEX CONCURRENTLY IF EXISTS sshkey_user_id")
+    print("  ✓ Dropped index sshkey_user_id")
+
+
+def migrate_sqlite():
+    """Drop redundant SSHKey index in SQLite."""
+    cursor = db.cursor()
+    cursor.execute("DROP INDEX IF EXISTS sshkey_user_id")
+    print("  ✓ Dropped index sshkey_user_id")
+
+
+def run():
+    """Run migration 016.
+
+    Returns:
+        True if successful or already applied, False otherwise
+    """
+    db.connect(reuse_if_open=True)
+
+    try:
+        # Check if should skip due to future migrations
+        if should_skip_due_to_future_migrations(MIGRATION_NUMBER, db, cfg):
+            print(
+                f"Migration {MIGRATION_NUMBER}: Skipped (superseded by future migration)"
+            )
+            return True
+
+        # Check if already applied
+        if not check_migration_needed():
+            print(
+                f"Migration {MIGRATION_NUMBER}: Already applied (sshkey_user_id index absent)"
+            )
+            return True
+
+        print("=" * 70)
+        print(f"Migration {MIGRATION_NUMBER}: Drop redundant SSHKey.user_id index")
+        print("=" * 70)
+
+        if cfg.app.db_backend == "postgres":
+            # CONCURRENTLY cannot run inside a transaction block
+            migrate_postgres()
+        else:
+            # Run migration in transaction
+            with db.atomic():
+                migrate_sqlite()
+
+        # Refresh planner statistics so lookups move to the composite index.
+        # Runs after commit so the DDL's locks are not held while sampling;
+        # the index is already gone, so a failure here is only a warning.
+        try:
+            db.execute_sql("ANALYZE sshkey")
+        except Exception as e:
+            print(f"  WARNING: ANALYZE failed (migration already committed): {e}")
+
+        print("\n" + "=" * 70)
+        print(f"Migration {MIGRATION_NUMBER}: ✓ Completed Successfully")
+        print("=" * 70)
+        return True
+
+    except Exception as e:
+        print(f"\n✗ Migration {MIGRATION_NUMBER} failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    run()
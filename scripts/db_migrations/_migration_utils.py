@@ -149,3 +149,37 @@ def check_column_exists(db, cfg, table_name: str, column_name: str) -> bool:
             return column_name in columns
     except Exception:
         return False
+
+
+def check_index_exists(db, cfg, table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table.
+
+    Args:
+        db: Database connection object
+        cfg: Config object with db_backend property
+        table_name: Name of the table
+        index_name: Name of the index to check
+
+    Returns:
+        True if index exists, False otherwise
+    """
+    try:
+        cursor = db.cursor()
+        if cfg.app.db_backend == "postgres":
+            cursor.execute(
+                """
+                SELECT indexname
+                FROM pg_indexes
+                WHERE tablename=%s AND indexname=%s
+            """,
+                (table_name, index_name),
+            )
+        else:
+            # SQLite
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=? AND name=?",
+                (table_name, index_name),
+            )
+        return cursor.fetchone() is not None
+    except Exception:
+        return False
@@ -1,25 +1,43 @@
 import sys
 import json
+import argparse
 from pathlib import Path
 
+parser = argparse.ArgumentParser(description="Generate JSON schema for the config")
+parser.add_argument(
+    "--force", action="store_true", help="Regenerate even if the schema is up to date"
+)
+args = parser.parse_args()
+
 # Add src to path so we can import kohakuhub
 src_path = Path(__file__).parent.parent / "src"
-sys.path.append(str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+output_dir = Path(__file__).parent.parent / "__generated__" / "schemas"
+output_file = output_dir / "config.json"
 
-from kohakuhub.config import Config
+# Skip regeneration if the schema is newer than the config models and this script
+src_mtime = max(
+    (src_path / "kohakuhub" / "config" / "_model.py").stat().st_mtime,
+    Path(__file__).stat().st_mtime,
+)
+if not args.force and output_file.exists() and output_file.stat().st_mtime > src_mtime:
+    print(f"Schema is up to date: {output_file}")
+    sys.exit(0)
+
+from kohakuhub.config._model import Config
 
 schema =  Config.model_json_schema()
 
 # Write to file
-output_dir = Path(__file__).parent.parent / "__generated__" / "schemas"
 output_dir.mkdir(parents=True, exist_ok=True)
-output_file = output_dir / "config.json"
 
 def move_defs_to_end(schema: dict) -> dict:
-    """Move $defs to the end of the schema."""
-    if '$defs' in schema:
-        defs = schema.pop('$defs')
-        schema['$defs'] = defs
+    """Move $defs to the end of the schema, with defs sorted by name."""
+    defs = schema.pop('$defs', None)
+    if defs:
+        schema['$defs'] = dict(sorted(defs.items()))
     return schema
 
 schema = move_defs_to_end(schema)
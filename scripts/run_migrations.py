@@ -125,6 +125,15 @@ def run_migrations():
     # Database is initialized, check for migrations
     print("Database is initialized, checking for pending migrations...\n")
 
+    if cfg.app.db_backend != "postgres":
+        # Each migration commits its own db.atomic() block; relax fsync for
+        # this connection only so those commits don't each pay a full sync.
+        # NORMAL is only crash-safe in WAL mode, so never apply it to a
+        # rollback-journal database.
+        journal_mode = db.execute_sql("PRAGMA journal_mode").fetchone()[0]
+        if journal_mode.lower() == "wal":
+            db.execute_sql("PRAGMA synchronous = NORMAL")
+
     # Discover migrations
     migrations = discover_migrations()
     if not migrations:
@@ -172,6 +181,9 @@ def run_migrations():
         print("\nFinalizing database schema (ensuring all tables/indexes exist)...")
         try:
             init_db()
+            if cfg.app.db_backend != "postgres":
+                # Let SQLite refresh stale planner stats after schema changes
+                db.execute_sql("PRAGMA optimize")
             print("[OK] Database schema finalized\n")
         except Exception as e:
             print(f"[ERROR] Failed to finalize database schema: {e}")
@@ -3,254 +3,23 @@
 import os
 from functools import lru_cache
 
-from pydantic import BaseModel
-
 try:
     import tomllib
 except ModuleNotFoundError:  # pragma: no cover - Python 3.10 fallback
     import tomli as tomllib
 
-# Default configuration values
-_DEFAULT_S3_ENDPOINT = "http://localhost:9000"
-
-
-class S3Config(BaseModel):
-    public_endpoint: str = _DEFAULT_S3_ENDPOINT
-    endpoint: str = _DEFAULT_S3_ENDPOINT
-    access_key: str = "test-access-key"
-    secret_key: str = "test-secret-key"
-    bucket: str = "test-bucket"
-    region: str = "us-east-1"  # auto (recommended), us-east-1, or specific AWS region
-    force_path_style: bool = True
-    signature_version: str | None = None  # s3v4 (R2, AWS S3) or None/s3v2 (MinIO)
-
-
-class LakeFSConfig(BaseModel):
-    endpoint: str = "http://localhost:8000"
-    access_key: str = "test-access-key"
-    secret_key: str = "test-secret-key"
-    repo_namespace: str = "hf"
-
-
-class SMTPConfig(BaseModel):
-    enabled: bool = False
-    host: str = "localhost"
-    port: int = 587
-    username: str = ""
-    password: str = ""
-    from_email: str = "noreply@localhost"
-    use_tls: bool = True
-
-
-class AuthConfig(BaseModel):
-    require_email_verification: bool = False
-    invitation_only: bool = False  # Disable public registration, require invitation
-    session_secret: str = "change-me-in-production"
-    session_expire_hours: int = 168  # 7 days
-    token_expire_days: int = 365
-
-
-class AdminConfig(BaseModel):
-    """Admin API configuration."""
-
-    enabled: bool = True
-    secret_token: str = "change-me-in-production"
-
-
-class QuotaConfig(BaseModel):
-    """Storage quota configuration."""
-
-    default_user_private_quota_bytes: int | None = None  # None = unlimited
-    default_user_public_quota_bytes: int | None = None  # None = unlimited
-    default_org_private_quota_bytes: int | None = None  # None = unlimited
-    default_org_public_quota_bytes: int | None = None  # None = unlimited
-
-
-class FallbackConfig(BaseModel):
-    """Fallback source configuration."""
-
-    enabled: bool = True  # Enable fallback system
-    cache_ttl_seconds: int = 30  # Cache TTL for repo→source mappings (default 30s post-#78)
-    timeout_seconds: int = 10  # HTTP request timeout for external sources
-    max_concurrent_requests: int = 5  # Max concurrent requests to external sources
-    require_auth: bool = False  # Require authenticated user for fallback access
-    # Global fallback sources (JSON list)
-    # Format: [{"url": "https://huggingface.co", "token": "", "priority": 1, "name": "HF", "source_type": "huggingface"}]
-    sources: list[dict] = []
-
-
-class CacheConfig(BaseModel):
-    """L2 cache (Valkey/Redis) configuration.
-
-    Pure cache, no business state. When ``enabled`` is False the cache layer
-    silently degrades and every call falls back to its source. See
-    ``docs/development/cache.md`` for the full design.
-    """
-
-    # Disabled by default so existing deployments don't acquire a hard
-    # dependency on Valkey unintentionally. Local-dev .env.dev.example flips
-    # this to True so contributors surface cache bugs early.
-    enabled: bool = False
-    url: str = "redis://localhost:6379/0"
-    # Namespace prefix isolates cache keys when multiple deployments share a
-    # single Valkey instance (rare in production, common in CI runners that
-    # reuse a managed Redis between jobs).
-    namespace: str = "kh"
-    # Default TTL applied by ``cache_set_json`` when callers don't pass one.
-    default_ttl_seconds: int = 300
-    # ±jitter fraction applied to every TTL inside the helper. Set to 0 to
-    # disable jitter (only useful for deterministic tests).
-    jitter_fraction: float = 0.15
-    # Connection pool size; tuned for ~4 uvicorn workers each running a
-    # handful of concurrent requests. Bump if a deployment scales beyond.
-    max_connections: int = 50
-    # Socket timeouts. Cache must never become a latency cliff — short
-    # timeouts so a flaky Valkey degrades to "cache miss" within ms, not s.
-    socket_timeout_seconds: float = 0.5
-    socket_connect_timeout_seconds: float = 0.5
-
-
-class AppConfig(BaseModel):
-    base_url: str = "http://localhost:48888"
-    # Allows local dev to expose frontend-facing URLs while backend self-calls stay direct.
-    internal_base_url: str | None = None
-    api_base: str = "/api"
-    db_backend: str = "sqlite"
-    # Optional features
-    disable_dataset_viewer: bool = False
-    database_url: str = "sqlite:///./hub.db"
-    database_key: str = (
-        ""  # Encryption key for external tokens (generate with: openssl rand -hex 32)
-    )
-    # Lower threshold to 5MB to account for base64 encoding overhead (~33%)
-    # 5MB file -> ~6.7MB base64, leaving room for multiple files in one commit
-    lfs_threshold_bytes: int = 5 * 1000 * 1000
-    debug_log_payloads: bool = False
-    # LFS Multipart Upload settings
-    lfs_multipart_threshold_bytes: int = (
-        100 * 1000 * 1000
-    )  # 100 MB - use multipart for files larger than this
-    lfs_multipart_chunk_size_bytes: int = (
-        50 * 1000 * 1000
-    )  # 50 MB - size of each part (S3 minimum is 5MB except last part)
-    # LFS Garbage Collection settings
-    lfs_keep_versions: int = 5  # Keep last K versions of each file
-    lfs_auto_gc: bool = False  # Auto-delete old LFS objects on commit
-    # Download tracking settings
-    download_time_bucket_seconds: int = 900  # 15 minutes - session deduplication window
-    download_session_cleanup_threshold: int = (
-        100  # Trigger cleanup when sessions > this
-    )
-    download_keep_sessions_days: int = 30  # Keep sessions from last N days
-    # LFS Suffix Rules - File extensions that should ALWAYS use LFS
-    # These are server-wide defaults that apply to ALL repositories
-    # Repositories can add their own additional suffix rules
-    lfs_suffix_rules_default: list[str] = [
-        # ML Model Formats
-        ".safetensors",  # SafeTensors (most common for HF models)
-        ".bin",  # PyTorch binary weights
-        ".pt",  # PyTorch checkpoint
-        ".pth",  # PyTorch checkpoint
-        ".ckpt",  # PyTorch Lightning checkpoint
-        ".onnx",  # ONNX model
-        ".pb",  # TensorFlow protobuf
-        ".h5",  # Keras/HDF5 model
-        ".tflite",  # TensorFlow Lite
-        ".gguf",  # GGUF quantized models (llama.cpp)
-        ".ggml",  # GGML models
-        ".msgpack",  # MessagePack serialization
-        # Compressed Archives
-        ".zip",  # ZIP archive
-        ".tar",  # TAR archive
-        ".gz",  # GZIP compressed
-        ".bz2",  # BZIP2 compressed
-        ".xz",  # XZ compressed
-        ".7z",  # 7-Zip archive
-        ".rar",  # RAR archive
-        # Data Files
-        ".npy",  # NumPy array
-        ".npz",  # NumPy compressed archive
-        ".arrow",  # Apache Arrow
-        ".parquet",  # Apache Parquet
-        # Media Files
-        ".mp4",  # Video
-        ".avi",  # Video
-        ".mkv",  # Video
-        ".mov",  # Video
-        ".wav",  # Audio
-        ".mp3",  # Audio
-        ".flac",  # Audio
-        # Images (large formats)
-        ".tiff",  # TIFF image
-        ".tif",  # TIFF image
-    ]
-    # Site identification
-    site_name: str = "KohakuHub"  # Configurable site name (e.g., "MyCompany Hub")
-    # Log settings
-    log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
-    log_format: str = (
-        "file"  # Output logs to "file" or "terminal" (maybe sql in future)
-    )
-    log_dir: str = "logs/"  # Path to log file (if log_format is "file")
-
-
-class Config(BaseModel):
-    s3: S3Config
-    lakefs: LakeFSConfig
-    smtp: SMTPConfig = SMTPConfig()
-    auth: AuthConfig = AuthConfig()
-    admin: AdminConfig = AdminConfig()
-    quota: QuotaConfig = QuotaConfig()
-    fallback: FallbackConfig = FallbackConfig()
-    cache: CacheConfig = CacheConfig()
-    app: AppConfig
-
-    def validate_production_safety(self) -> list[str]:
-        """Check if configuration uses unsafe default values.
-
-        Returns:
-            List of warning messages for unsafe defaults
-        """
-        warnings = []
-
-        # S3 credentials
-        if self.s3.access_key == "test-access-key":
-            warnings.append("S3 access_key is using test default value")
-        if self.s3.secret_key == "test-secret-key":
-            warnings.append("S3 secret_key is using test default value")
-        if self.s3.bucket == "test-bucket":
-            warnings.append("S3 bucket is using test default value")
-
-        # LakeFS credentials
-        if self.lakefs.access_key == "test-access-key":
-            warnings.append("LakeFS access_key is using test default value")
-        if self.lakefs.secret_key == "test-secret-key":
-            warnings.append("LakeFS secret_key is using test default value")
-
-        # Auth secrets
-        if self.auth.session_secret == "change-me-in-production":
-            warnings.append("Session secret is using default value - SECURITY RISK!")
-        if self.admin.secret_token == "change-me-in-production":
-            warnings.append(
-                "Admin secret token is using default value - SECURITY RISK!"
-            )
-
-        # LFS GC settings validation
-        if self.app.lfs_keep_versions < 2:
-            warnings.append(
-                f"LFS keep_versions={self.app.lfs_keep_versions} is too low! "
-                f"Minimum recommended: 5. Revert/reset operations will likely fail. "
-                f"Set KOHAKU_HUB_LFS_KEEP_VERSIONS=5 or higher."
-            )
-
-        # LFS threshold validation
-        if self.app.lfs_threshold_bytes < 1000 * 1000:  # Less than 1MB
-            warnings.append(
-                f"LFS threshold is very low ({self.app.lfs_threshold_bytes} bytes). "
-                f"Consider setting to at least 5MB (5242880 bytes)."
-            )
-
-        return warnings
+from ._model import (
+    AdminConfig,
+    AppConfig,
+    AuthConfig,
+    CacheConfig,
+    Config,
+    FallbackConfig,
+    LakeFSConfig,
+    QuotaConfig,
+    S3Config,
+    SMTPConfig,
+)
 
 
 def update_recursive(d: dict, u: dict) -> dict:
@@ -547,4 +316,10 @@ def load_config(path: str = None) -> Config:
     )
 
 
-cfg = load_config()
+def __getattr__(name: str):
+    # Load ``cfg`` on first access so importing ``kohakuhub.config._model``
+    # alone never reads config.toml or the environment.
+    if name == "cfg":
+        globals()["cfg"] = load_config()
+        return globals()["cfg"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -319,7 +319,9 @@ class SSHKey(BaseModel):
     """User SSH public keys for Git operations."""
 
     id = AutoField()
-    user = ForeignKeyField(User, backref="ssh_keys", on_delete="CASCADE", index=True)
+    # No standalone user_id index: the unique (user, fingerprint) index below
+    # has user_id as its leftmost column, so it already serves user lookups.
+    user = ForeignKeyField(User, backref="ssh_keys", on_delete="CASCADE", index=False)
     key_type = CharField()  # "ssh-rsa", "ssh-ed25519", "ecdsa-sha2-nistp256", etc.
     public_key = TextField()  # Full public key content
     fingerprint = CharField(unique=True, index=True)  # SHA256 fingerprint for lookup
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import io
+import os
+import subprocess
+import sys
 from contextlib import contextmanager
+from pathlib import Path
 
 import pytest
 
@@ -240,3 +244,60 @@ def test_load_config_explicit_disable_wins_over_implicit_enable(monkeypatch):
 
     cfg = hub_config.load_config()
     assert cfg.cache.enabled is False
+
+
+def test_importing_config_models_does_not_load_config(tmp_path):
+    """``kohakuhub.config._model`` must be importable without reading
+    config.toml or the environment; schema generation relies on it.
+
+    Runs in a fresh interpreter so the ``kohakuhub.config`` package
+    ``__init__`` really executes, with HUB_CONFIG pointing at a TOML file
+    that would make ``load_config`` fail.
+    """
+    bad_config = tmp_path / "broken.toml"
+    bad_config.write_text("this is [not valid toml")
+    src_dir = Path(hub_config.__file__).resolve().parents[2]
+
+    env = dict(os.environ)
+    env["HUB_CONFIG"] = str(bad_config)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(src_dir), env.get("PYTHONPATH")])
+    )
+    script = (
+        "import sys\n"
+        "import kohakuhub.config._model as model\n"
+        "assert model.Config.model_json_schema()['title'] == 'Config'\n"
+        "assert 'cfg' not in vars(sys.modules['kohakuhub.config'])\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_cfg_is_loaded_once_and_cached_in_module_globals(monkeypatch):
+    sentinel = object()
+    calls = []
+
+    def _load_config(*_args, **_kwargs):
+        calls.append(1)
+        return sentinel
+
+    monkeypatch.delitem(vars(hub_config), "cfg", raising=False)
+    monkeypatch.setattr(hub_config, "load_config", _load_config)
+
+    assert hub_config.cfg is sentinel
+    assert hub_config.cfg is sentinel
+    assert len(calls) == 1
+    assert vars(hub_config)["cfg"] is sentinel
+
+
+def test_unknown_config_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no_such_setting"):
+        hub_config.no_such_setting